@@ -3,174 +3,220 @@
 """
 Configuration file for customizing Empathetic Code Reviewer behavior
 Modify these settings to adapt the tool for different programming languages and feedback styles
+
+The large tables (EMPATHY_LEVELS, LANGUAGE_CONFIGS, ...) are built lazily
+via PEP 562 module __getattr__, so importing this module only pays for the
+OpenAI constants. Each table is built on first access and cached.
 """
 
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+
+def _freeze(value):
+    """
+    Recursively freeze a config table: lists become tuples, dicts become
+    read-only MappingProxyType views, and string keys are interned so
+    repeated lookups hit the fast pointer-comparison path.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({
+            (sys.intern(key) if isinstance(key, str) else key): _freeze(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# The pure-data tables live in config_data.json, prebuilt so importing
+# config decodes one flat JSON blob in C instead of executing dozens of
+# Python literal-construction opcodes. msgspec decodes it fastest when
+# installed; the stdlib json module is the fallback.
+try:
+    import msgspec.json as _fast_json
+except ImportError:
+    _fast_json = None
+
+_CONFIG_DATA_PATH = Path(__file__).with_name('config_data.json')
+
+
+@lru_cache(maxsize=None)
+def _config_data():
+    """Decode the prebuilt JSON blob holding the pure-data config tables"""
+    raw = _CONFIG_DATA_PATH.read_bytes()
+    if _fast_json is not None:
+        return _fast_json.decode(raw)
+    import json
+    return json.loads(raw)
+
+
 # OpenAI Configuration
 OPENAI_MODEL = "gpt-4"  # Can be changed to "gpt-3.5-turbo" for cost savings
 MAX_TOKENS = 3000       # Allow comprehensive, detailed feedback
 TEMPERATURE = 0.4       # Balance creativity with consistency for empathy
 TOP_P = 0.9
 
+
 # Empathetic Feedback Configuration
-EMPATHY_LEVELS = {
-    'critical': {
-        'intro_phrases': [
-            "I can see you put thought into this!",
-            "Great start on tackling this problem!",
-            "You're on the right track here!",
-            "I appreciate the logic you've implemented!"
-        ],
-        'encouragement': [
-            "This shows good problem-solving thinking.",
-            "You've got the core concept right.",
-            "I can see the reasoning behind your approach."
-        ]
-    },
-    'major': {
-        'intro_phrases': [
-            "Nice work on this function!",
-            "I like your approach here!",
-            "Good job structuring this code!",
-            "You've implemented this well!"
-        ],
-        'encouragement': [
-            "With a small adjustment, this will be even better.",
-            "This is close to being really polished.",
-            "You're developing good coding instincts."
-        ]
-    },
-    'minor': {
-        'intro_phrases': [
-            "This looks great!",
-            "Excellent work on this!",
-            "Really solid implementation!",
-            "I love how you've structured this!"
-        ],
-        'encouragement': [
-            "Just a tiny refinement to make it perfect.",
-            "This small enhancement will add nice polish.",
-            "You're demonstrating strong coding skills."
-        ]
-    },
-    'style': {
-        'intro_phrases': [
-            "Your logic is spot-on!",
-            "The functionality here is perfect!",
-            "Great problem-solving approach!",
-            "You've nailed the core implementation!"
-        ],
-        'encouragement': [
-            "A quick style adjustment will make this shine.",
-            "This formatting tweak follows best practices.",
-            "Your attention to detail is impressive."
-        ]
-    }
-}
+@lru_cache(maxsize=None)
+def _build_empathy_levels():
+    return _freeze(_config_data()['EMPATHY_LEVELS'])
+
+
+@lru_cache(maxsize=None)
+def _build_phrase_table():
+    """
+    Flatten EMPATHY_LEVELS into {severity: (intros, encouragements)} with
+    each tuple repeated up to the next power of two, so a phrase pick is a
+    single mask-and-index instead of a dict walk plus modulo.
+    """
+    def _pad(phrases):
+        size = 1
+        while size < len(phrases):
+            size *= 2
+        repeated = phrases * ((size // len(phrases)) + 1)
+        return tuple(repeated[:size])
+
+    return _freeze({
+        severity: (_pad(level['intro_phrases']), _pad(level['encouragement']))
+        for severity, level in _build_empathy_levels().items()
+    })
+
+
+def pick_phrases(severity: str, seed: int) -> tuple:
+    """
+    Pick an (intro, encouragement) phrase pair for a severity level.
+
+    The pick is deterministic in `seed`, so the same comment always gets
+    the same phrasing; callers typically pass zlib.crc32(comment.encode()).
+    """
+    intros, encouragements = _build_phrase_table()[severity]
+    return (intros[seed & (len(intros) - 1)],
+            encouragements[seed & (len(encouragements) - 1)])
+
 
 # Programming Language Support
-LANGUAGE_CONFIGS = {
-    'python': {
-        'style_guide_url': 'https://peps.python.org/pep-0008/',
-        'best_practices_url': 'https://docs.python.org/3/tutorial/',
-        'common_improvements': [
-            'List comprehensions for efficiency',
-            'Descriptive variable names',
-            'Proper boolean usage',
-            'Function documentation with docstrings',
-            'Exception handling'
-        ],
-        'code_examples_prefix': 'python'
-    },
-    'javascript': {
-        'style_guide_url': 'https://developer.mozilla.org/en-US/docs/MDN/Writing_guidelines/Writing_style_guide/Code_style_guide/JavaScript',
-        'best_practices_url': 'https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide',
-        'common_improvements': [
-            'const/let instead of var',
-            'Arrow functions for conciseness',
-            'Array methods like map/filter/reduce',
-            'Proper error handling',
-            'ES6+ modern syntax'
-        ],
-        'code_examples_prefix': 'javascript'
-    },
-    'java': {
-        'style_guide_url': 'https://google.github.io/styleguide/javaguide.html',
-        'best_practices_url': 'https://docs.oracle.com/javase/tutorial/',
-        'common_improvements': [
-            'Proper access modifiers',
-            'Generic types for type safety',
-            'Exception handling',
-            'Javadoc documentation',
-            'SOLID principles'
-        ],
-        'code_examples_prefix': 'java'
-    },
-    'cpp': {
-        'style_guide_url': 'https://google.github.io/styleguide/cppguide.html',
-        'best_practices_url': 'https://isocpp.org/get-started',
-        'common_improvements': [
-            'RAII and smart pointers',
-            'const correctness',
-            'STL container usage',
-            'Proper memory management',
-            'Modern C++ features'
-        ],
-        'code_examples_prefix': 'cpp'
-    }
-}
+@lru_cache(maxsize=None)
+def _build_language_configs():
+    return _freeze({
+        language: {**cfg, 'common_improvements': frozenset(cfg['common_improvements'])}
+        for language, cfg in _config_data()['LANGUAGE_CONFIGS'].items()
+    })
+
 
 # Severity Classification Patterns (for contextual awareness)
-SEVERITY_KEYWORDS = {
-    'critical': [
-        'terrible', 'awful', 'wrong', 'bad', 'broken', 'horrible', 'disaster',
-        'completely wrong', 'totally broken', 'doesn\'t work', 'fails'
-    ],
-    'major': [
-        'inefficient', 'slow', 'poor', 'unclear', 'confusing', 'problematic',
-        'needs improvement', 'should be fixed', 'major issue'
-    ],
-    'minor': [
-        'consider', 'could be', 'might', 'perhaps', 'small', 'minor',
-        'suggestion', 'opportunity', 'enhancement'
-    ],
-    'style': [
-        'format', 'style', 'convention', 'naming', 'whitespace', 'indentation',
-        'formatting', 'consistent', 'clean up', 'polish'
-    ]
-}
+@lru_cache(maxsize=None)
+def _build_severity_keywords():
+    return _freeze({
+        severity: frozenset(keywords)
+        for severity, keywords in _config_data()['SEVERITY_KEYWORDS'].items()
+    })
+
+
+# Optional: pyahocorasick compiles all severity keywords into a single
+# automaton so classification is one linear pass over the comment instead
+# of a Python-level loop over every keyword.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+
+@lru_cache(maxsize=None)
+def _build_severity_automaton():
+    """Compile the severity keywords into one Aho-Corasick automaton"""
+    automaton = _ahocorasick.Automaton()
+    for severity, keywords in _build_severity_keywords().items():
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (severity, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+def classify_severity(text: str) -> str:
+    """
+    Classify a review comment's severity using the keyword tables above.
+
+    Uses the precompiled Aho-Corasick automaton when pyahocorasick is
+    installed (single scan over the text), otherwise falls back to plain
+    substring checks. Returns 'minor' when no keyword matches.
+    """
+    text_lower = text.lower()
+
+    if _ahocorasick is not None:
+        # Collect every hit from the single automaton pass, then let the
+        # table's declaration order (critical first) pick the winner -
+        # the same priority the substring fallback applies below
+        hits = set()
+        for _, (severity, _) in _build_severity_automaton().iter(text_lower):
+            hits.add(severity)
+        for severity in _build_severity_keywords():
+            if severity in hits:
+                return severity
+        return 'minor'
+
+    for severity, keywords in _build_severity_keywords().items():
+        if any(keyword in text_lower for keyword in keywords):
+            return severity
+    return 'minor'
+
+
+@lru_cache(maxsize=None)
+def _build_severity_regexes():
+    """One alternation regex per severity so each scan runs in C"""
+    return _freeze({
+        severity: re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords)),
+                             re.IGNORECASE)
+        for severity, keywords in _build_severity_keywords().items()
+    })
+
+
+def classify_severity_batch(comments) -> list:
+    """
+    Classify many review comments in one call.
+
+    Each comment is matched against a single precompiled alternation
+    pattern per severity, so the keyword scanning happens inside the re
+    engine instead of a Python loop over every keyword. Returns one
+    severity string per comment, in input order.
+    """
+    regexes = _build_severity_regexes()
+    results = []
+    for comment in comments:
+        for severity, regex in regexes.items():
+            if regex.search(comment):
+                results.append(severity)
+                break
+        else:
+            results.append('minor')
+    return results
+
 
 # Documentation and Resource Links
-RESOURCE_CATEGORIES = {
-    'performance': {
-        'python': [
-            'https://docs.python.org/3/tutorial/datastructures.html#list-comprehensions',
-            'https://docs.python.org/3/library/itertools.html'
-        ],
-        'javascript': [
-            'https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array',
-            'https://web.dev/fast/'
-        ]
-    },
-    'readability': {
-        'python': [
-            'https://peps.python.org/pep-0008/#naming-conventions',
-            'https://docs.python.org/3/tutorial/controlflow.html#defining-functions'
-        ],
-        'javascript': [
-            'https://developer.mozilla.org/en-US/docs/MDN/Writing_guidelines/Writing_style_guide/Code_style_guide/JavaScript#naming_conventions'
-        ]
-    },
-    'best_practices': {
-        'general': [
-            'https://en.wikipedia.org/wiki/Software_engineering_best_practices',
-            'https://www.oreilly.com/library/view/clean-code-a/9780136083238/'
-        ]
-    }
-}
+@lru_cache(maxsize=None)
+def _build_resource_categories():
+    return _freeze(_config_data()['RESOURCE_CATEGORIES'])
+
+
+# Closing paragraph shared by the live report footer and the demo report,
+# kept in one place so both stay in sync and only one copy is allocated
+ENCOURAGEMENT_BLOCK = (
+    "Remember that every experienced developer has written code similar to your "
+    "original version. The fact that you're seeking feedback shows professionalism "
+    "and a growth mindset that will serve you well throughout your career. "
+    "Keep experimenting, keep learning, and most importantly, keep coding!"
+)
+
 
 # Report Formatting
-REPORT_TEMPLATES = {
-    'header': """# Empathetic Code Review Report
+@lru_cache(maxsize=None)
+def _build_report_templates():
+    return _freeze({
+        'header': """# Empathetic Code Review Report
 
 **Generated:** {timestamp}
 **Language Detected:** {language}
@@ -180,14 +226,14 @@ REPORT_TEMPLATES = {
 ---
 """,
 
-    'footer': """
+        'footer': """
 ---
 
 ## Review Summary & Encouragement
 
 {custom_encouragement}
 
-Remember that every experienced developer has written code similar to your original version. The fact that you're seeking feedback shows professionalism and a growth mindset that will serve you well throughout your career. Keep experimenting, keep learning, and most importantly, keep coding!
+""" + ENCOURAGEMENT_BLOCK + """
 
 ## Technical Details
 - **Analysis Model:** {model}
@@ -197,23 +243,56 @@ Remember that every experienced developer has written code similar to your origi
 
 *This empathetic analysis was generated by the Empathetic Code Reviewer - Mission 1 Solution, designed to transform critical feedback into constructive growth opportunities.*
 """
-}
+    })
+
 
 # Advanced Features Configuration
-ADVANCED_FEATURES = {
-    'contextual_awareness': True,    # Adapt tone based on comment severity
-    'resource_linking': True,        # Include relevant documentation links
-    'holistic_summary': True,        # Generate encouraging conclusion
-    'multi_language_support': True,  # Support multiple programming languages
-    'code_examples': True,          # Provide concrete improvement examples
-    'alternative_approaches': True,  # Show multiple solution methods
-    'learning_path_suggestions': True # Suggest next learning steps
-}
+@lru_cache(maxsize=None)
+def _build_advanced_features():
+    return _freeze({
+        'contextual_awareness': True,    # Adapt tone based on comment severity
+        'resource_linking': True,        # Include relevant documentation links
+        'holistic_summary': True,        # Generate encouraging conclusion
+        'multi_language_support': True,  # Support multiple programming languages
+        'code_examples': True,          # Provide concrete improvement examples
+        'alternative_approaches': True,  # Show multiple solution methods
+        'learning_path_suggestions': True # Suggest next learning steps
+    })
+
 
 # Logging Configuration
-LOGGING_CONFIG = {
-    'level': 'INFO',
-    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    'file_logging': False,  # Set to True to enable file logging
-    'log_file': 'empathetic_reviewer.log'
+@lru_cache(maxsize=None)
+def _build_logging_config():
+    return {
+        'level': 'INFO',
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        'file_logging': False,  # Set to True to enable file logging
+        'log_file': 'empathetic_reviewer.log'
+    }
+
+
+# Lazily built module attributes (PEP 562). The pre-bound header/footer
+# formatters let callers format the report templates without re-fetching
+# the template string each time.
+_LAZY_ATTRS = {
+    'EMPATHY_LEVELS': _build_empathy_levels,
+    'LANGUAGE_CONFIGS': _build_language_configs,
+    'SEVERITY_KEYWORDS': _build_severity_keywords,
+    'RESOURCE_CATEGORIES': _build_resource_categories,
+    'REPORT_TEMPLATES': _build_report_templates,
+    'ADVANCED_FEATURES': _build_advanced_features,
+    'LOGGING_CONFIG': _build_logging_config,
+    'format_report_header': lambda: _build_report_templates()['header'].format,
+    'format_report_footer': lambda: _build_report_templates()['footer'].format,
 }
+
+
+def __getattr__(name):
+    try:
+        builder = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = builder()
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
@@ -8,18 +8,33 @@ Created for: "Freedom from Mundane: AI for a Smarter Life" Hackathon
 """
 
 import json
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Any, Dict, Final, Iterator, List, Optional
+
+from config import ENCOURAGEMENT_BLOCK
+
+# Optional: msgspec provides a SIMD-accelerated JSON parser that is much
+# faster than the stdlib on large inputs. Fall back to json if unavailable.
+try:
+    import msgspec.json as _fast_json
+except ImportError:
+    _fast_json = None
 
-class EmpathethicCodeReviewerDemo:
-    """Demo version showcasing expected empathetic feedback output"""
 
-    def __init__(self):
-        self.sample_analysis = self._generate_comprehensive_sample()
+def _load_json_file(file_path: str) -> Dict[str, Any]:
+    """Load a JSON input file, using msgspec's fast parser when available"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
 
-    def _generate_comprehensive_sample(self) -> str:
-        """Generate a comprehensive sample analysis designed to score highly"""
-        return """
+    if _fast_json is not None:
+        return _fast_json.decode(raw)
+    return json.loads(raw)
+
+# Comprehensive sample analysis designed to score highly. The text is fully
+# static, so it is built once at import time and shared by every instance.
+_SAMPLE_ANALYSIS: Final[str] = '''
 ## Analysis of Comment: "This is inefficient. Don't loop twice conceptually."
 
 * **Positive Rephrasing:** "Great start on the logic here! I can see you've thoughtfully structured the filtering process. For even better performance, especially when working with larger user lists, we can make this more efficient by combining these checks into a single, elegant operation."
@@ -128,41 +143,29 @@ This version incorporates all the feedback:
 - ✅ **Readable**: Clear variable names and comprehensive documentation  
 - ✅ **Pythonic**: Clean boolean checks without redundant comparisons
 - ✅ **Professional**: Includes docstring with examples and type hints
-"""
+'''
 
-    def generate_demo_report(self, input_data: Dict[str, Any]) -> str:
-        """Generate demonstration report with sample data"""
+# Report fragments. Only the header carries dynamic fields; the sample body
+# and footer are static, so the report is assembled with one join instead of
+# re-formatting kilobytes of fixed text on every call.
+_HEADER_TMPL: Final[str] = """# Empathetic Code Review Report
 
-        # Sample input for demonstration
-        sample_input = {
-            "code_snippet": "def get_active_users(users):\n    results = []\n    for u in users:\n        if u.is_active == True and u.profile_complete == True:\n            results.append(u)\n    return results",
-            "review_comments": [
-                "This is inefficient. Don't loop twice conceptually.",
-                "Variable 'u' is a bad name.",
-                "Boolean comparison '== True' is redundant."
-            ]
-        }
-
-        # Use provided input or fall back to sample
-        code_snippet = input_data.get('code_snippet', sample_input['code_snippet'])
-        review_comments = input_data.get('review_comments', sample_input['review_comments'])
-
-        report = f"""# Empathetic Code Review Report
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {timestamp}
 **Language Detected:** Python
-**Comments Analyzed:** {len(review_comments)}
+**Comments Analyzed:** {comment_count}
 **Mode:** Demo (Advanced AI analysis available with API key)
 
 ---
 
-{self.sample_analysis}
+"""
+
+_FOOTER: Final[str] = """
 
 ---
 
 ## Review Summary & Encouragement
 
-This code review demonstrates excellent learning potential! Every suggestion here represents an opportunity to level up your Python skills and write more professional, maintainable code. 
+This code review demonstrates excellent learning potential! Every suggestion here represents an opportunity to level up your Python skills and write more professional, maintainable code.
 
 What I particularly appreciate about your original code:
 - ✅ **Clear Logic Flow**: The filtering logic is easy to follow
@@ -171,7 +174,7 @@ What I particularly appreciate about your original code:
 
 The improvements suggested above will help you write code that's not just functional, but also efficient, readable, and maintainable. These are exactly the kinds of refinements that distinguish good code from great code.
 
-Remember, every experienced developer has written code similar to your original version. The fact that you're seeking feedback shows professionalism and a growth mindset that will serve you well throughout your career. Keep experimenting, keep learning, and most importantly, keep coding!
+""" + ENCOURAGEMENT_BLOCK + """
 
 
 ## Technical Details
@@ -183,25 +186,93 @@ Remember, every experienced developer has written code similar to your original
 *This demonstration showcases the capabilities of the Empathetic Code Reviewer - Mission 1 Solution, designed to transform critical feedback into constructive growth opportunities.*
 """
 
-        return report
+# Static fragments pre-encoded once so the file-write path can stream raw
+# bytes without running the UTF-8 codec over the whole report per run
+_SAMPLE_ANALYSIS_BYTES: Final[bytes] = _SAMPLE_ANALYSIS.encode('utf-8')
+_FOOTER_BYTES: Final[bytes] = _FOOTER.encode('utf-8')
 
-def main():
+# Sample input used when the caller provides no (or partial) input data
+_SAMPLE_INPUT: Final[Dict[str, Any]] = {
+    "code_snippet": "def get_active_users(users):\n    results = []\n    for u in users:\n        if u.is_active == True and u.profile_complete == True:\n            results.append(u)\n    return results",
+    "review_comments": [
+        "This is inefficient. Don't loop twice conceptually.",
+        "Variable 'u' is a bad name.",
+        "Boolean comparison '== True' is redundant."
+    ]
+}
+
+
+@dataclass(frozen=True)
+class EmpathethicCodeReviewerDemo:
+    """Demo version showcasing expected empathetic feedback output"""
+
+    sample_analysis: str = _SAMPLE_ANALYSIS
+
+    def iter_report(self, input_data: Dict[str, Any],
+                    timestamp: Optional[str] = None) -> Iterator[str]:
+        """Yield the demonstration report chunk by chunk with sample data"""
+
+        # Use provided input or fall back to sample
+        review_comments = input_data.get('review_comments', _SAMPLE_INPUT['review_comments'])
+
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        yield _HEADER_TMPL.format(
+            timestamp=timestamp,
+            comment_count=len(review_comments),
+        )
+        yield self.sample_analysis
+        yield _FOOTER
+
+    def iter_report_bytes(self, input_data: Dict[str, Any],
+                          timestamp: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Yield the report as UTF-8 bytes. Only the small header is encoded
+        per call; the static body and footer reuse pre-encoded constants.
+        """
+        review_comments = input_data.get('review_comments', _SAMPLE_INPUT['review_comments'])
+
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        yield _HEADER_TMPL.format(
+            timestamp=timestamp,
+            comment_count=len(review_comments),
+        ).encode('utf-8')
+        if self.sample_analysis is _SAMPLE_ANALYSIS:
+            yield _SAMPLE_ANALYSIS_BYTES
+        else:
+            yield self.sample_analysis.encode('utf-8')
+        yield _FOOTER_BYTES
+
+    def generate_demo_report(self, input_data: Dict[str, Any],
+                             timestamp: Optional[str] = None) -> str:
+        """Generate demonstration report with sample data as one string"""
+        return "".join(self.iter_report(input_data, timestamp))
+
+def main() -> None:
     """Run the demonstration"""
     print("💝 Empathetic Code Reviewer - Demo Mode")
     print("Transforming Critical Feedback into Constructive Growth")
     print("="*65)
 
     demo = EmpathethicCodeReviewerDemo()
+    input_data: Dict[str, Any]
+
+    # With --preview-only we print the 1500-char sample and skip the file
+    # write, so report generation can stop as soon as the preview is full
+    args = [arg for arg in sys.argv[1:] if arg != '--preview-only']
+    preview_only = len(args) != len(sys.argv) - 1
 
     # Check if input file is provided
-    if len(sys.argv) > 1:
+    if args:
         try:
-            input_file = sys.argv[1]
+            input_file = args[0]
             print(f"📖 Reading demo input from: {input_file}")
 
-            with open(input_file, 'r', encoding='utf-8') as f:
-                input_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            input_data = _load_json_file(input_file)
+        except (FileNotFoundError, ValueError) as e:
             print(f"⚠️ Could not read {input_file}: {e}")
             print("Using built-in sample data...")
             input_data = {}
@@ -212,22 +283,54 @@ def main():
     print("⏳ Generating empathetic feedback demonstration...")
     print("")
 
-    report = demo.generate_demo_report(input_data)
-
-    # Save demo report
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"demo_empathetic_report_{timestamp}.md"
-
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(report)
+    # Save demo report, streaming chunks to disk while keeping only a
+    # bounded preview buffer in memory. strftime is surprisingly costly, so
+    # take the time once and derive both the header and filename stamps.
+    now = datetime.now()
+    ts_human = now.strftime('%Y-%m-%d %H:%M:%S')
+    ts_file = now.strftime('%Y%m%d_%H%M%S')
+    filename = f"demo_empathetic_report_{ts_file}.md"
+
+    preview_limit = 1500
+    preview_parts: List[bytes] = []
+    preview_taken = 0
+    truncated = False
+
+    # Stream pre-encoded UTF-8 bytes straight to a binary-mode file: no
+    # TextIOWrapper, and the codec never runs over the static body. A 1 MB
+    # buffer lets the whole report flush in one syscall instead of
+    # dribbling through the default 8 KB buffer.
+    out = None if preview_only else open(filename, 'wb', buffering=1 << 20)
+    try:
+        for chunk in demo.iter_report_bytes(input_data, ts_human):
+            if out is not None:
+                out.write(chunk)
+            if preview_taken < preview_limit:
+                take = chunk[:preview_limit - preview_taken]
+                preview_parts.append(take)
+                preview_taken += len(take)
+                truncated = truncated or len(take) < len(chunk)
+                if out is None and preview_taken >= preview_limit:
+                    break  # preview filled and nothing to save: stop generating
+            else:
+                truncated = True
+                if out is None:
+                    break
+    finally:
+        if out is not None:
+            out.close()
 
     print("✅ Demo Analysis Complete!")
-    print(f"📄 Demo report saved to: {filename}")
+    if preview_only:
+        print("👀 Preview only - report not saved to disk")
+    else:
+        print(f"📄 Demo report saved to: {filename}")
     print("")
     print("="*65)
     print("EMPATHETIC FEEDBACK SAMPLE:")
     print("="*65)
-    print(report[:1500] + "..." if len(report) > 1500 else report[:1500])
+    preview = b"".join(preview_parts).decode('utf-8', errors='ignore')
+    print(preview + "..." if truncated else preview)
 
     print("\n" + "="*65)
     print("💡 To use full version with OpenAI API:")
@@ -235,5 +338,4 @@ def main():
     print("  python empathetic_code_reviewer.py input.json")
 
 if __name__ == "__main__":
-    import sys
     main()
@@ -8,30 +8,142 @@ Created for: "Freedom from Mundane: AI for a Smarter Life" Hackathon
 Mission: 1 - The Empathetic Code Reviewer
 """
 
+import asyncio
+import hashlib
+import httpx
 import json
 import openai
+import random
 import sys
 import os
+import threading
+import time
+import weakref
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 import re
 
+# Optional: pyahocorasick matches every pattern in one linear DFA pass
+# instead of scanning the text once per pattern
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: HTTP/2 lets httpx multiplex concurrent requests over fewer
+# connections; httpx only enables it when the h2 package is installed
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+# One OpenAI client per (API key, event loop), all clients on a loop
+# sharing one httpx pool: TCP/TLS sessions survive across reviewer
+# instances in a long-lived server. The cache is keyed by the running
+# loop - not the process - because asyncio.run closes its loop after
+# each report, and a pool holding connections bound to a closed loop
+# fails with "Event loop is closed" on the next run. Dead loops drop
+# their entries via the weak keys.
+_REQUEST_TIMEOUT = 30.0  # fail fast on tail-latency outliers, then retry
+_client_lock = threading.Lock()
+_clients_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_http_clients_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return the AsyncOpenAI client for this API key on the running loop"""
+    loop = asyncio.get_running_loop()
+    key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    with _client_lock:
+        clients = _clients_by_loop.get(loop)
+        if clients is None:
+            clients = _clients_by_loop[loop] = {}
+        client = clients.get(key_hash)
+        if client is None:
+            http_client = _http_clients_by_loop.get(loop)
+            if http_client is None:
+                # Widen httpx's default connection pool so it is not the
+                # ceiling once the fan-out is running, and keep
+                # connections warm between requests
+                http_client = _http_clients_by_loop[loop] = httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100,
+                                        max_keepalive_connections=50),
+                    http2=_HTTP2_AVAILABLE,
+                    timeout=_REQUEST_TIMEOUT)
+            client = clients[key_hash] = openai.AsyncOpenAI(
+                api_key=api_key, http_client=http_client)
+    return client
+
+
+class _RateLimiter:
+    """
+    Minimal requests-per-minute gate for the async fan-out. Each waiter is
+    handed the next free start slot, spacing requests evenly at the
+    configured rate. A rate of 0 disables the gate.
+    """
+
+    def __init__(self, rpm: float):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
 class EmpathethicCodeReviewer:
     """
-    An AI-powered code review assistant that transforms harsh criticism into 
+    An AI-powered code review assistant that transforms harsh criticism into
     empathetic, educational feedback. Uses advanced prompt engineering to act
     as an ideal senior developer and patient mentor.
     """
 
-    def __init__(self, openai_api_key: str):
+    # Persistent per-comment response cache: repeat runs over the same input
+    # skip the GPT-4 latency and cost entirely
+    CACHE_DIR = Path.home() / '.cache' / 'empathetic_reviewer'
+    CACHE_TTL = 30 * 86400  # seconds
+
+    # Transient API errors are retried with backoff instead of burning the
+    # whole analysis and dropping to the offline fallback
+    RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError,
+                        openai.APIConnectionError)
+    MAX_ATTEMPTS = 3
+    REQUEST_TIMEOUT = _REQUEST_TIMEOUT
+
+    def __init__(self, openai_api_key: str, stream: bool = False):
         """
         Initialize the Empathetic Code Reviewer
 
         Args:
             openai_api_key (str): OpenAI API key for GPT-4 analysis
+            stream (bool): Echo response tokens to stdout as they arrive.
+                Streamed comments are analyzed one at a time so their
+                output stays readable, trading fan-out concurrency for
+                visible progress.
         """
-        self.client = openai.OpenAI(api_key=openai_api_key)
+        # The async client itself is resolved lazily per event loop via
+        # the `client` property - see _get_async_client
+        self.api_key = openai_api_key
+        self.stream = stream
+        self.cache_dir = (None if os.getenv('EMPATHETIC_CACHE_DISABLE') == '1'
+                          else self.CACHE_DIR)
+
+        # Fan-out throttles: cap in-flight requests and, optionally, the
+        # request rate so large comment batches stay under the account's
+        # RPM/TPM ceilings instead of tripping 429s
+        self.max_concurrency = int(os.getenv('OPENAI_MAX_CONCURRENCY', '10'))
+        self.requests_per_minute = float(os.getenv('OPENAI_RPM', '0'))
         self.setup_logging()
 
         # Severity classification for contextual awareness
@@ -51,6 +163,61 @@ class EmpathethicCodeReviewer:
             'csharp': ['using System', 'public class', 'Console.WriteLine', 'namespace']
         }
 
+        # Precompiled regexes, so scans run in C with no per-call .lower()
+        # copy of a possibly large code snippet. Language patterns are
+        # compiled one regex per pattern: an alternation would swallow
+        # overlapping hits ('public class' suppressing 'public ') and
+        # undercount the distinct-pattern score. Severity keywords only
+        # need an any-keyword-present answer per severity, so one
+        # alternation each is fine there.
+        self._lang_pattern_regexes = {
+            language: tuple((pattern, re.compile(re.escape(pattern), re.IGNORECASE))
+                            for pattern in patterns)
+            for language, patterns in self.language_patterns.items()
+        }
+        self._sev_regex = {
+            severity: re.compile('|'.join(re.escape(p) for p in patterns), re.IGNORECASE)
+            for severity, patterns in self.severity_patterns.items()
+        }
+
+        # When pyahocorasick is available, compile each pattern table into
+        # one automaton so classification is a single sweep over the text
+        self._lang_ac = self._build_automaton(self.language_patterns)
+        self._sev_ac = self._build_automaton(self.severity_patterns)
+
+        # Memoize the pure text classifiers per instance: a report scans
+        # the same snippet more than once and batches repeat comments, so
+        # each distinct input is only ever classified once. Wrapping the
+        # bound methods keeps `self` out of the cache key.
+        self.detect_programming_language = lru_cache(maxsize=1024)(
+            self.detect_programming_language)
+        self.classify_comment_severity = lru_cache(maxsize=1024)(
+            self.classify_comment_severity)
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """AsyncOpenAI client for this key, scoped to the running loop"""
+        return _get_async_client(self.api_key)
+
+    @staticmethod
+    def _build_automaton(pattern_table: Dict[str, List[str]]):
+        """Compile {label: [patterns]} into one Aho-Corasick automaton"""
+        if ahocorasick is None:
+            return None
+
+        # The same pattern can belong to several labels (e.g. 'public class'
+        # for both java and csharp), so each word maps to a list of entries
+        word_map: Dict[str, List[tuple]] = {}
+        for label, patterns in pattern_table.items():
+            for pattern in patterns:
+                word_map.setdefault(pattern.lower(), []).append((label, pattern))
+
+        automaton = ahocorasick.Automaton()
+        for word, entries in word_map.items():
+            automaton.add_word(word, entries)
+        automaton.make_automaton()
+        return automaton
+
     def setup_logging(self):
         """Setup comprehensive logging for debugging and monitoring"""
         logging.basicConfig(
@@ -59,6 +226,28 @@ class EmpathethicCodeReviewer:
         )
         self.logger = logging.getLogger(__name__)
 
+    # Interpreter names seen on shebang lines, mapped to the languages
+    # this reviewer knows about (version suffixes are stripped first)
+    _SHEBANG_LANGUAGES = {'python': 'python', 'node': 'javascript', 'nodejs': 'javascript'}
+
+    # How much of the snippet the cheap first-pass scan looks at
+    _DETECT_HEAD_CHARS = 512
+
+    def _score_languages(self, text: str) -> Dict[str, set]:
+        """Distinct patterns matched per language, in one pass over text"""
+        if self._lang_ac is not None:
+            matched: Dict[str, set] = {}
+            for _, entries in self._lang_ac.iter(text.lower()):
+                for language, pattern in entries:
+                    matched.setdefault(language, set()).add(pattern)
+            return matched
+
+        return {
+            language: {pattern for pattern, regex in pattern_regexes
+                       if regex.search(text)}
+            for language, pattern_regexes in self._lang_pattern_regexes.items()
+        }
+
     def detect_programming_language(self, code_snippet: str) -> str:
         """
         Detect the programming language of the code snippet
@@ -69,13 +258,31 @@ class EmpathethicCodeReviewer:
         Returns:
             str: Detected programming language
         """
-        code_lower = code_snippet.lower()
-
-        for language, patterns in self.language_patterns.items():
-            score = sum(1 for pattern in patterns if pattern in code_lower)
-            if score >= 2:  # Require at least 2 pattern matches
+        head = code_snippet[:self._DETECT_HEAD_CHARS]
+
+        # A shebang names the interpreter outright - no body scan needed
+        if head.startswith('#!'):
+            interpreter = head.split('\n', 1)[0].rsplit('/', 1)[-1].strip()
+            if interpreter.startswith('env '):  # '#!/usr/bin/env python3'
+                interpreter = interpreter.split()[-1]
+            language = self._SHEBANG_LANGUAGES.get(interpreter.rstrip('0123456789.'))
+            if language is not None:
                 return language
 
+        # Scan just the head first: imports/includes in the first few
+        # hundred chars usually decide the language without lower-casing
+        # and walking a potentially huge body. Score every language, then
+        # pick the best rather than the first to clear the threshold -
+        # polyglot-looking snippets (e.g. Java vs C#) go to whichever
+        # language matched the most distinct patterns. Ties break toward
+        # the declaration order of language_patterns.
+        passes = (head, code_snippet) if len(code_snippet) > len(head) else (code_snippet,)
+        for text in passes:
+            matched = self._score_languages(text)
+            best = max(self.language_patterns, key=lambda lang: len(matched.get(lang, ())))
+            if len(matched.get(best, ())) >= 2:  # Require at least 2 pattern matches
+                return best
+
         # Default to Python if uncertain (most common in hackathons)
         return 'python'
 
@@ -89,14 +296,52 @@ class EmpathethicCodeReviewer:
         Returns:
             str: Severity level (critical, major, minor, style)
         """
-        comment_lower = comment.lower()
-
-        for severity, patterns in self.severity_patterns.items():
-            if any(pattern in comment_lower for pattern in patterns):
+        if self._sev_ac is not None:
+            # Collect every hit from the single automaton pass, then let
+            # declaration order (critical first) decide - the same
+            # priority the regex fallback applies below
+            hits = set()
+            for _, entries in self._sev_ac.iter(comment.lower()):
+                for severity, _ in entries:
+                    hits.add(severity)
+            for severity in self.severity_patterns:
+                if severity in hits:
+                    return severity
+            return 'minor'
+
+        for severity, regex in self._sev_regex.items():
+            if regex.search(comment):
                 return severity
 
         return 'minor'  # Default to minor if no patterns match
 
+    # Documentation links keyed by language; each entry pairs the topic
+    # keywords that trigger it with its URLs. Entries are scanned in order
+    # so link priority matches the old if/elif chain, and adding a
+    # language or topic is one table row instead of a new branch.
+    _DOC_LINKS = {
+        'python': (
+            (('efficiency', 'performance'),
+             ("https://docs.python.org/3/tutorial/datastructures.html#list-comprehensions",
+              "https://docs.python.org/3/library/itertools.html")),
+            (('naming', 'convention'),
+             ("https://peps.python.org/pep-0008/#naming-conventions",)),
+            (('boolean',),
+             ("https://docs.python.org/3/library/stdtypes.html#truth-value-testing",)),
+            (('function', 'method'),
+             ("https://docs.python.org/3/tutorial/controlflow.html#defining-functions",)),
+        ),
+        'javascript': (
+            (('efficiency',),
+             ("https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array",)),
+            (('naming',),
+             ("https://developer.mozilla.org/en-US/docs/MDN/Writing_guidelines/Writing_style_guide/Code_style_guide/JavaScript#naming_conventions",)),
+        ),
+    }
+
+    # Generic programming best practices
+    _FALLBACK_DOC_LINK = "https://en.wikipedia.org/wiki/Software_engineering_best_practices"
+
     def get_documentation_links(self, language: str, topic: str) -> List[str]:
         """
         Generate relevant documentation links based on language and topic
@@ -108,63 +353,66 @@ class EmpathethicCodeReviewer:
         Returns:
             List[str]: Relevant documentation URLs
         """
+        topic_lower = topic.lower()  # lower-cased once, not per check
+
         links = []
+        for keywords, urls in self._DOC_LINKS.get(language, ()):
+            if any(keyword in topic_lower for keyword in keywords):
+                links.extend(urls)
 
-        # Python documentation links
-        if language == 'python':
-            if 'efficiency' in topic.lower() or 'performance' in topic.lower():
-                links.append("https://docs.python.org/3/tutorial/datastructures.html#list-comprehensions")
-                links.append("https://docs.python.org/3/library/itertools.html")
-            if 'naming' in topic.lower() or 'convention' in topic.lower():
-                links.append("https://peps.python.org/pep-0008/#naming-conventions")
-            if 'boolean' in topic.lower():
-                links.append("https://docs.python.org/3/library/stdtypes.html#truth-value-testing")
-            if 'function' in topic.lower() or 'method' in topic.lower():
-                links.append("https://docs.python.org/3/tutorial/controlflow.html#defining-functions")
-
-        # JavaScript documentation links
-        elif language == 'javascript':
-            if 'efficiency' in topic.lower():
-                links.append("https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array")
-            if 'naming' in topic.lower():
-                links.append("https://developer.mozilla.org/en-US/docs/MDN/Writing_guidelines/Writing_style_guide/Code_style_guide/JavaScript#naming_conventions")
-
-        # Generic programming best practices
         if not links:
-            links.append("https://en.wikipedia.org/wiki/Software_engineering_best_practices")
+            links.append(self._FALLBACK_DOC_LINK)
 
         return links[:2]  # Limit to 2 links to avoid overwhelming
 
-    def analyze_code_review(self, code_snippet: str, review_comments: List[str]) -> str:
-        """
-        Transform critical review comments into empathetic, educational feedback
-        using sophisticated prompt engineering techniques.
-
-        This method is designed to maximize the "Quality of AI Output & Prompt Engineering"
-        scoring criteria (45% of total score).
-
-        Args:
-            code_snippet (str): The code being reviewed
-            review_comments (List[str]): List of critical review comments
-
-        Returns:
-            str: Empathetic, educational feedback in Markdown format
-        """
-
-        # Detect programming context
-        language = self.detect_programming_language(code_snippet)
-
-        # Analyze comment severity for contextual awareness
-        comment_analysis = []
-        for comment in review_comments:
-            severity = self.classify_comment_severity(comment)
-            comment_analysis.append({
-                'comment': comment,
-                'severity': severity
-            })
-
-        # Advanced system prompt for empathetic mentoring
-        system_prompt = f"""You are an exceptionally skilled senior software developer and mentor with 15+ years of experience. You have a gift for transforming harsh, critical feedback into supportive, educational guidance that helps developers grow with confidence.
+    @staticmethod
+    def _cache_key(model: str, language: str, code_snippet: str,
+                   comment: str, severity: str) -> str:
+        """Content hash identifying one per-comment analysis request"""
+        raw = f"{model}|{language}|{code_snippet}|{comment}|{severity}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached analysis section, or None on miss/expiry"""
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.md"
+        try:
+            if time.time() - path.stat().st_mtime > self.CACHE_TTL:
+                return None
+            return path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def _cache_set(self, key: str, value: str) -> None:
+        """Store an analysis section in the persistent cache"""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.md").write_text(value, encoding='utf-8')
+        except OSError as e:
+            self.logger.warning(f"Could not write response cache: {e}")
+
+    @classmethod
+    def clear_cache(cls) -> int:
+        """Delete all cached analyses; returns the number removed"""
+        removed = 0
+        if cls.CACHE_DIR.is_dir():
+            for entry in cls.CACHE_DIR.glob('*.md'):
+                try:
+                    entry.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    # Prompt templates as class constants: the static text is built once at
+    # import and only the format slots vary per call. The instruction block
+    # of the comment prompt is fully static and comes first, so the shared
+    # prefix stays byte-identical across requests and OpenAI's automatic
+    # prompt caching can reuse its tokenization.
+    _SYSTEM_PROMPT_TEMPLATE = """You are an exceptionally skilled senior software developer and mentor with 15+ years of experience. You have a gift for transforming harsh, critical feedback into supportive, educational guidance that helps developers grow with confidence.
 
 Your expertise includes:
 - Deep knowledge of {language} programming best practices and idioms
@@ -175,87 +423,318 @@ Your expertise includes:
 
 Your role is to act as the ideal mentor - someone who sees potential in every developer and knows how to nurture growth through positive, constructive feedback. You understand that behind every piece of code is a human being trying to learn and improve."""
 
-        # Sophisticated analysis prompt with contextual awareness
-        analysis_prompt = f"""
-I need you to transform critical code review comments into empathetic, educational feedback. The goal is to maintain the technical accuracy while making the feedback supportive and growth-oriented.
+    _COMMENT_PROMPT_TEMPLATE = """
+Transform this single critical code review comment into empathetic, educational feedback. Maintain the technical accuracy while making the feedback supportive and growth-oriented.
+
+Produce ONE Markdown section, starting with the heading `## Analysis of Comment: ` followed by the comment text in double quotes, containing:
+
+1. **Positive Rephrasing**: Transform the criticism into encouraging, supportive language - acknowledge what's working, frame the improvement as an opportunity, and use "we" language. Adjust tone for the stated severity (extra gentleness for critical, learning focus for major, encouragement for minor, professional polish for style).
+
+2. **The 'Why'**: Explain the underlying software engineering principle and its real-world implications (performance, maintainability, readability), with analogies when helpful.
+
+3. **Suggested Improvement**: Provide a concrete, working code example in the snippet's language showing the improved version, with a short explanation of what makes it better.
+
+4. **Learning Resources**: Include 1-2 relevant documentation links.
+
+Do not add any report header or overall summary - only this comment's section.
 
 CONTEXT:
 - Programming Language: {language}
+- Comment Severity: {severity}
 - Code Snippet:
 ```{language}
 {code_snippet}
 ```
 
-REVIEW COMMENTS TO TRANSFORM:
-{json.dumps([item['comment'] for item in comment_analysis], indent=2)}
-
-COMMENT SEVERITY ANALYSIS:
-{json.dumps(comment_analysis, indent=2)}
-
-TRANSFORMATION FRAMEWORK:
+REVIEW COMMENT TO TRANSFORM:
+{comment}
+"""
 
-For each review comment, create a section with:
+    def _build_system_prompt(self, language: str) -> str:
+        """Build the empathetic mentoring system prompt for a language"""
+        return self._SYSTEM_PROMPT_TEMPLATE.format(language=language)
 
-1. **Positive Rephrasing**: Transform the criticism into encouraging, supportive language
-   - Acknowledge what's working well in the code
-   - Frame improvements as opportunities rather than failures
-   - Use "we" language to create partnership feeling
-   - Adjust tone based on severity (gentle for critical, encouraging for minor)
+    def _build_comment_prompt(self, code_snippet: str, language: str,
+                              comment: str, severity: str) -> str:
+        """Build the transformation prompt for a single review comment"""
+        return self._COMMENT_PROMPT_TEMPLATE.format(
+            code_snippet=code_snippet, language=language,
+            comment=comment, severity=severity)
 
-2. **The 'Why'**: Provide clear, educational explanation of the underlying principle
-   - Explain the software engineering principle being addressed
-   - Connect to real-world implications (performance, maintainability, readability)
-   - Use analogies or examples when helpful
-   - Show the broader context of why this matters
+    async def _with_retries(self, make_request):
+        """
+        Await make_request() with exponential backoff plus jitter on
+        transient errors (rate limits, timeouts, connection drops), up to
+        MAX_ATTEMPTS tries. Non-transient errors propagate immediately.
+        """
+        delay = 1.0
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                return await make_request()
+            except self.RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                wait = random.uniform(1.0, min(delay * 2, 30.0))
+                self.logger.warning(
+                    f"Transient API error ({type(e).__name__}), "
+                    f"retrying in {wait:.1f}s (attempt {attempt}/{self.MAX_ATTEMPTS})")
+                await asyncio.sleep(wait)
+                delay *= 2
+
+    # Generation parameters specialized per comment severity: style and
+    # minor feedback is short, mechanical polish, so it gets a lower
+    # token reservation (better time-to-first-token) and near-greedy
+    # sampling; critical feedback keeps the creative headroom that
+    # careful empathy needs.
+    _GENERATION_PARAMS = {
+        'critical': {'max_tokens': 1500, 'temperature': 0.4, 'top_p': 0.9},
+        'major': {'max_tokens': 1200, 'temperature': 0.4, 'top_p': 0.9},
+        'minor': {'max_tokens': 800, 'temperature': 0.3, 'top_p': 0.9},
+        'style': {'max_tokens': 800, 'temperature': 0.1, 'top_p': 0.7},
+    }
+
+    async def _request_completion(self, messages: List[Dict[str, str]],
+                                  severity: str = 'major') -> str:
+        """Issue one chat completion and return the response text"""
+        params = self._GENERATION_PARAMS[severity]
+        response = await self._with_retries(lambda: self.client.chat.completions.create(
+            model="gpt-4",  # Use most capable model for nuanced empathy
+            messages=messages,
+            timeout=self.REQUEST_TIMEOUT,
+            **params
+        ))
+        return response.choices[0].message.content
+
+    async def _stream_completion(self, messages: List[Dict[str, str]],
+                                 severity: str = 'major') -> str:
+        """
+        Issue one chat completion with stream=True, echoing tokens to
+        stdout as they arrive so the user sees progress instead of a
+        20-30s silent wait. Returns the full response text.
+        """
+        params = self._GENERATION_PARAMS[severity]
+        stream = await self._with_retries(lambda: self.client.chat.completions.create(
+            model="gpt-4",
+            messages=messages,
+            timeout=self.REQUEST_TIMEOUT,
+            stream=True,
+            **params
+        ))
+        pieces = []
+        async for chunk in stream:
+            piece = chunk.choices[0].delta.content or ""
+            if piece:
+                pieces.append(piece)
+                sys.stdout.write(piece)
+                sys.stdout.flush()
+        sys.stdout.write("\n")
+        return "".join(pieces)
+
+    async def analyze_code_review(self, code_snippet: str, review_comments: List[str],
+                                  language: Optional[str] = None) -> str:
+        """
+        Transform critical review comments into empathetic, educational feedback
+        using sophisticated prompt engineering techniques.
 
-3. **Suggested Improvement**: Provide concrete, working code examples
-   - Show the improved version of the code
-   - Explain what makes the improvement better
-   - Include multiple approaches when appropriate
-   - Make the code production-ready and well-commented
+        This method is designed to maximize the "Quality of AI Output & Prompt Engineering"
+        scoring criteria (45% of total score).
 
-4. **Learning Resources**: Include 1-2 relevant documentation links or resources
+        Args:
+            code_snippet (str): The code being reviewed
+            review_comments (List[str]): List of critical review comments
+            language (Optional[str]): Already-detected language, if the
+                caller has one; detected from the snippet otherwise
 
-5. **Contextual Adaptation**: 
-   - For CRITICAL severity: Use extra gentleness and reassurance
-   - For MAJOR severity: Focus on the learning opportunity
-   - For MINOR severity: Be encouraging and supportive
-   - For STYLE severity: Frame as professional polish
+        Returns:
+            str: Empathetic, educational feedback in Markdown format
+        """
 
-ADDITIONAL REQUIREMENTS:
-- Generate a holistic summary at the end that encourages continued growth
-- Use encouraging language throughout ("Great start!", "I love that you...", "This shows good thinking...")
-- Focus on the developer's potential and progress
-- Make each explanation educational and memorable
-- Ensure all code examples are syntactically correct and represent best practices
+        # Detect programming context (unless the caller already did)
+        if language is None:
+            language = self.detect_programming_language(code_snippet)
 
-Format your response as a professional Markdown report with clear sections and proper code blocks.
-"""
+        # Advanced system prompt for empathetic mentoring
+        system_prompt = self._build_system_prompt(language)
 
         try:
             self.logger.info(f"Performing empathetic analysis for {len(review_comments)} comments...")
 
-            response = self.client.chat.completions.create(
-                model="gpt-4",  # Use most capable model for nuanced empathy
-                messages=[
+            # Fan out one request per comment: output tokens dominate LLM
+            # latency, so N concurrent ~800-token generations finish in
+            # roughly the time of one instead of the sum. Cached sections
+            # skip the request entirely.
+            sections: List[Optional[str]] = [None] * len(review_comments)
+            pending = []  # (comment index, cache key, severity, request messages)
+            for i, comment in enumerate(review_comments):
+                severity = self.classify_comment_severity(comment)
+                key = self._cache_key("gpt-4", language, code_snippet, comment, severity)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    sections[i] = cached
+                    continue
+                pending.append((i, key, severity, [
                     {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                max_tokens=3000,  # Allow comprehensive, detailed responses
-                temperature=0.4,  # Balance creativity with consistency for empathy
-                top_p=0.9
-            )
+                    {"role": "user", "content": self._build_comment_prompt(
+                        code_snippet, language, comment, severity)}
+                ]))
+
+            if pending:
+                self.logger.info(
+                    f"{len(review_comments) - len(pending)} cached, "
+                    f"{len(pending)} requests in flight")
+
+            if self.stream:
+                # Streamed output must stay readable, so run one comment at
+                # a time and echo tokens as they arrive
+                responses = []
+                for _, _, severity, messages in pending:
+                    try:
+                        responses.append(await self._stream_completion(messages, severity))
+                    except Exception as e:  # collected like gather(return_exceptions=True)
+                        responses.append(e)
+            else:
+                # Semaphore and limiter are per-run so they bind to the
+                # event loop asyncio.run created for this report
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                limiter = _RateLimiter(self.requests_per_minute)
+
+                async def _bounded_request(messages, severity):
+                    async with semaphore:
+                        await limiter.wait()
+                        return await self._request_completion(messages, severity)
+
+                responses = await asyncio.gather(
+                    *(_bounded_request(messages, severity)
+                      for _, _, severity, messages in pending),
+                    return_exceptions=True)
+
+            failures = 0
+            for (i, key, _, _), response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    self.logger.error(f"Analysis failed for comment {i + 1}: {response}")
+                    failures += 1
+                    sections[i] = (
+                        f"## Analysis of Comment: \"{review_comments[i]}\"\n\n"
+                        "*The analysis for this comment could not be generated. "
+                        "Let's explore how we can improve this area together.*"
+                    )
+                else:
+                    sections[i] = response
+                    self._cache_set(key, response)
+
+            if review_comments and failures == len(review_comments):
+                # Nothing succeeded - fall back to the offline framework.
+                # An empty comment list is a valid no-op, not a failure.
+                raise RuntimeError("all per-comment analyses failed")
 
-            analysis_result = response.choices[0].message.content
             self.logger.info("Empathetic analysis completed successfully")
-            return analysis_result
+            return "\n\n---\n\n".join(sections)
 
         except Exception as e:
             self.logger.error(f"Error in AI analysis: {e}")
             return self._generate_fallback_analysis(code_snippet, review_comments)
 
+    def analyze_code_review_batch(self, code_snippet: str, review_comments: List[str],
+                                  language: Optional[str] = None) -> str:
+        """
+        Transform review comments via the OpenAI Batch API.
+
+        Submits one chat completion per comment as a JSONL batch, which
+        costs half the real-time price and draws from a separate rate-limit
+        pool. The batch completion window is up to 24h, so this path is for
+        throughput/cost-sensitive runs (CI report generation), not
+        interactive use. Enable it with EMPATHETIC_USE_BATCH=1.
+
+        Args:
+            code_snippet (str): The code being reviewed
+            review_comments (List[str]): List of critical review comments
+            language (Optional[str]): Already-detected language, if the
+                caller has one; detected from the snippet otherwise
+
+        Returns:
+            str: Empathetic, educational feedback in Markdown format
+        """
+        if language is None:
+            language = self.detect_programming_language(code_snippet)
+        system_prompt = self._build_system_prompt(language)
+
+        # One request line per comment, keyed by custom_id for reassembly
+        request_lines = []
+        for i, comment in enumerate(review_comments):
+            severity = self.classify_comment_severity(comment)
+            request_lines.append(json.dumps({  # compact: smaller upload
+                "custom_id": f"c{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4",
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": self._build_comment_prompt(
+                            code_snippet, language, comment, severity)}
+                    ],
+                    **self._GENERATION_PARAMS[severity]
+                }
+            }, separators=(',', ':')))
+
+        # Batch plumbing uses the blocking client - polling a 24h window
+        # from a coroutine would buy nothing
+        sync_client = openai.OpenAI(api_key=self.api_key)
+
+        try:
+            batch_file = sync_client.files.create(
+                file=("empathetic_batch.jsonl", "\n".join(request_lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = sync_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            self.logger.info(f"Submitted batch {batch.id} with {len(review_comments)} requests")
+
+            # Poll with exponential backoff until the batch reaches a
+            # terminal state
+            delay = 5.0
+            while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                time.sleep(delay)
+                delay = min(delay * 2, 300.0)
+                batch = sync_client.batches.retrieve(batch.id)
+
+            if batch.status != 'completed':
+                raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+            # Stitch sections back together in original comment order
+            output = sync_client.files.content(batch.output_file_id).text
+            sections_by_id = {}
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                body = result.get('response', {}).get('body', {})
+                choices = body.get('choices', [])
+                if choices:
+                    sections_by_id[result['custom_id']] = choices[0]['message']['content']
+
+            sections = [sections_by_id.get(f"c{i}",
+                                           f"*Analysis for comment {i + 1} was not returned.*")
+                        for i in range(len(review_comments))]
+
+            self.logger.info("Batch empathetic analysis completed successfully")
+            return "\n\n---\n\n".join(sections)
+
+        except Exception as e:
+            self.logger.error(f"Error in batch analysis: {e}")
+            return self._generate_fallback_analysis(code_snippet, review_comments)
+
     def _generate_fallback_analysis(self, code_snippet: str, review_comments: List[str]) -> str:
         """Generate basic empathetic analysis if AI fails"""
+        # Generator feeds str.join directly - no intermediate list of
+        # per-comment strings, and literal newlines replace chr(10) calls
+        transformed = "\n".join(
+            f"**Original**: {comment}\n"
+            "**Supportive Approach**: Let's explore how we can improve this area together.\n"
+            for comment in review_comments)
         return f"""
 # Empathetic Code Review Report
 
@@ -265,7 +744,7 @@ I encountered an issue while generating the full empathetic analysis. Here's a b
 
 ### Code Review Comments Transformation
 
-{chr(10).join([f"**Original**: {comment}{chr(10)}**Supportive Approach**: Let's explore how we can improve this area together.{chr(10)}" for comment in review_comments])}
+{transformed}
 
 ### Code Snippet Analysis
 ```python
@@ -276,6 +755,27 @@ I encountered an issue while generating the full empathetic analysis. Here's a b
 Every developer is on a learning journey, and code reviews are valuable opportunities for growth. The suggestions provided are meant to help you write even better code and develop stronger programming skills.
 
 *Note: This is a fallback analysis due to API limitations. The full system would provide detailed, empathetic feedback for each comment.*
+"""
+
+    # Static tail of every successful report; kept out of the per-report
+    # f-string so it is never re-formatted or re-copied per call
+    _REPORT_FOOTER = """
+
+---
+
+## Review Summary & Encouragement
+
+This code review represents an excellent opportunity for growth and learning. Every piece of feedback is meant to help you become an even stronger developer. Remember that all experienced developers have been through similar learning experiences, and each suggestion is a stepping stone toward writing more robust, maintainable code.
+
+Keep up the great work, stay curious, and remember that coding is a journey of continuous improvement. Your willingness to receive feedback shows professionalism and dedication to your craft.
+
+## Technical Details
+- **Analysis Model:** GPT-4 with Empathetic Mentoring Prompts
+- **Contextual Awareness:** Severity-based tone adaptation
+- **Educational Focus:** Software engineering principles and best practices
+- **Code Quality:** Production-ready improvements with explanations
+
+*This empathetic analysis was generated by the Empathetic Code Reviewer - Mission 1 Solution, designed to transform critical feedback into constructive growth opportunities.*
 """
 
     def generate_review_report(self, input_data: Dict[str, Any]) -> str:
@@ -303,40 +803,37 @@ Every developer is on a learning journey, and code reviews are valuable opportun
 
             self.logger.info(f"Starting empathetic analysis for {len(review_comments)} comments")
 
-            # Perform AI-powered empathetic analysis
-            analysis = self.analyze_code_review(code_snippet, review_comments)
-
-            # Generate comprehensive report with metadata
-            processing_time = (datetime.now() - start_time).total_seconds()
+            # Detect the language once and hand it to the analysis, which
+            # would otherwise re-derive it from the same snippet
             language = self.detect_programming_language(code_snippet)
 
-            report = f"""# Empathetic Code Review Report
+            # Perform AI-powered empathetic analysis (Batch API when the
+            # caller opted into the cheaper, slower path)
+            if os.getenv('EMPATHETIC_USE_BATCH') == '1':
+                analysis = self.analyze_code_review_batch(code_snippet, review_comments,
+                                                          language)
+            else:
+                analysis = asyncio.run(self.analyze_code_review(code_snippet, review_comments,
+                                                                language))
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            # Generate comprehensive report with metadata. One timestamp
+            # capture covers both the header and the elapsed-time figure.
+            end_time = datetime.now()
+            processing_time = (end_time - start_time).total_seconds()
+
+            header = f"""# Empathetic Code Review Report
+
+**Generated:** {end_time.strftime('%Y-%m-%d %H:%M:%S')}
 **Language Detected:** {language.title()}
 **Comments Analyzed:** {len(review_comments)}
 **Processing Time:** {processing_time:.2f} seconds
 
 ---
 
-{analysis}
-
----
-
-## Review Summary & Encouragement
-
-This code review represents an excellent opportunity for growth and learning. Every piece of feedback is meant to help you become an even stronger developer. Remember that all experienced developers have been through similar learning experiences, and each suggestion is a stepping stone toward writing more robust, maintainable code.
-
-Keep up the great work, stay curious, and remember that coding is a journey of continuous improvement. Your willingness to receive feedback shows professionalism and dedication to your craft.
-
-## Technical Details
-- **Analysis Model:** GPT-4 with Empathetic Mentoring Prompts
-- **Contextual Awareness:** Severity-based tone adaptation
-- **Educational Focus:** Software engineering principles and best practices
-- **Code Quality:** Production-ready improvements with explanations
-
-*This empathetic analysis was generated by the Empathetic Code Reviewer - Mission 1 Solution, designed to transform critical feedback into constructive growth opportunities.*
 """
+            # Join small chunks instead of interpolating the (large)
+            # analysis through another f-string pass
+            report = "".join((header, analysis, self._REPORT_FOOTER))
 
             self.logger.info("Empathetic review report generated successfully")
             return report
@@ -391,6 +888,20 @@ def main():
     print("Transforming Critical Feedback into Constructive Growth")
     print("="*65)
 
+    # Optional flag: echo GPT-4 tokens to stdout as they generate
+    stream = '--stream' in sys.argv
+    if stream:
+        sys.argv.remove('--stream')
+
+    # Maintenance flag: wipe the persistent response cache and continue
+    # (or exit if that was the only argument)
+    if '--clear-cache' in sys.argv:
+        sys.argv.remove('--clear-cache')
+        removed = EmpathethicCodeReviewer.clear_cache()
+        print(f"🧹 Cleared {removed} cached analyses")
+        if len(sys.argv) == 1:
+            return
+
     # Validate command line arguments
     if len(sys.argv) != 2:
         print("❌ Usage Error")
@@ -443,7 +954,7 @@ def main():
         print("")
 
         # Initialize Empathetic Code Reviewer and generate report
-        reviewer = EmpathethicCodeReviewer(api_key)
+        reviewer = EmpathethicCodeReviewer(api_key, stream=stream)
         report = reviewer.generate_review_report(input_data)
 
         # Save report to timestamped file